@@ -647,6 +647,9 @@ class ModuleTestCluster(TestCluster):
         ):
             return
         self.__generators[generated_type].add(generator)
+        # Types that had no generators so far might be generatable now.
+        self.get_generators_for.cache_clear()
+        self.get_all_generatable_types.cache_clear()
 
     def add_accessible_object_under_test(  # noqa: D102
         self, objc: GenericAccessibleObject, data: _CallableData
@@ -27,6 +27,7 @@ from typing import Final
 from typing import ForwardRef
 from typing import Generic
 from typing import TypeVar
+from typing import Union
 from typing import _BaseGenericAlias  # type: ignore[attr-defined]
 from typing import _eval_type  # type: ignore[attr-defined]
 from typing import cast
@@ -36,7 +37,6 @@ from typing import get_type_hints
 import networkx as nx
 
 from networkx.drawing.nx_pydot import to_pydot
-from typing_inspect import is_union_type
 
 import pynguin.configuration as config
 import pynguin.utils.typetracing as tt
@@ -1714,20 +1714,16 @@ class TypeSystem:
             # TODO(fk) Tuple without size. Should use tuple[Any, ...] ?
             #  But ... (ellipsis) is not a type.
             return TupleType((ANY,), unknown_size=True)
-        if get_origin(hint) is tuple:
+        origin = get_origin(hint)
+        if origin is tuple:
             # tuple[int, str] or typing.Tuple[int, str] or typing.Tuple
             args = self.__convert_args_if_exists(hint, unsupported=unsupported)
             if not args:
                 return TupleType((ANY,), unknown_size=True)
             return TupleType(args)
-        if is_union_type(hint) or isinstance(hint, types.UnionType):
+        if origin is Union or origin is types.UnionType or hint is Union:
             # int | str or typing.Union[int, str]
-            # TODO(fk) don't make a union including Any.
-            return UnionType(
-                tuple(
-                    sorted(self.__convert_args_if_exists(hint, unsupported=unsupported))
-                )
-            )
+            return self.__convert_union_hint(hint, unsupported)
         if isinstance(hint, _BaseGenericAlias | types.GenericAlias):
             # list[int, str] or List[int, str] or Dict[int, str] or set[str]
             result = Instance(
@@ -1748,6 +1744,16 @@ class TypeSystem:
         # Should raise an error in the future.
         return unsupported
 
+    @functools.lru_cache(maxsize=1024)
+    def __convert_union_hint(self, hint: Any, unsupported: ProperType) -> UnionType:
+        # Union hints are hashable and the same ones are converted over and over
+        # again.  Sorting the elements is costly, because it compares their string
+        # representations, so cache the result.
+        # TODO(fk) don't make a union including Any.
+        return UnionType(
+            tuple(sorted(self.__convert_args_if_exists(hint, unsupported=unsupported)))
+        )
+
     def __convert_args_if_exists(
         self, hint: Any, unsupported: ProperType
     ) -> tuple[ProperType, ...]:
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 from abc import ABCMeta
 from abc import abstractmethod
+from itertools import islice
 from typing import TYPE_CHECKING
 
 from pynguin.utils import randomness
@@ -247,13 +248,18 @@ class TestCase(metaclass=ABCMeta):
             A list of variable references satisfying the parameter type
         """
         variables: list[vr.VariableReference] = []
-        bound = min(len(self._statements), position)
-        for i in range(bound):
-            statement = self._statements[i]
+        is_maybe_subtype = self.test_cluster.type_system.is_maybe_subtype
+        # Most test cases contain many variables of the same few types, thus we only
+        # check the subtype relation once per distinct type.
+        matches: dict[ProperType, bool] = {}
+        for statement in islice(self._statements, max(position, 0)):
             var = statement.ret_val
             if var is None:
                 continue
-            if self.test_cluster.type_system.is_maybe_subtype(var.type, parameter_type):
+            typ = var.type
+            if (match := matches.get(typ)) is None:
+                match = matches[typ] = is_maybe_subtype(typ, parameter_type)
+            if match:
                 variables.append(var)
 
         return variables
@@ -268,9 +274,8 @@ class TestCase(metaclass=ABCMeta):
             A list of all objects defined up to the given position
         """
         variables: list[vr.VariableReference] = []
-        bound = min(len(self._statements), position)
-        for i in range(bound):
-            var = self.get_statement(i).ret_val
+        for statement in islice(self._statements, max(position, 0)):
+            var = statement.ret_val
             if var is None:
                 continue
             if not var.is_none_type():
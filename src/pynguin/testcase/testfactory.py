@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import logging
 
+from itertools import islice
 from typing import TYPE_CHECKING
 from typing import cast
 
@@ -50,6 +51,16 @@ class TestFactory:
 
     _logger = logging.getLogger(__name__)
 
+    # Maps each kind of accessible object to the name of the method that adds it to
+    # a test case, and whether that method takes the allow_none argument.
+    _ACCESSIBLE_ADDERS: dict[type[gao.GenericAccessibleObject], tuple[str, bool]] = {
+        gao.GenericConstructor: ("add_constructor", True),
+        gao.GenericMethod: ("add_method", True),
+        gao.GenericFunction: ("add_function", True),
+        gao.GenericField: ("add_field", False),
+        gao.GenericEnum: ("add_enum", False),
+    }
+
     def __init__(
         self,
         test_cluster: ModuleTestCluster,
@@ -143,45 +154,39 @@ class TestFactory:
             ConstructionFailedException: if construction of an object failed
         """
         new_position = test_case.size() if position == -1 else position
-        if isinstance(accessible, gao.GenericConstructor):
-            return self.add_constructor(
-                test_case,
-                accessible,
-                position=new_position,
-                allow_none=allow_none,
-                recursion_depth=recursion_depth,
-            )
-        if isinstance(accessible, gao.GenericMethod):
-            return self.add_method(
-                test_case,
-                accessible,
-                position=new_position,
-                allow_none=allow_none,
-                recursion_depth=recursion_depth,
+        # Use __class__ instead of type() to look up the adder; they only differ for
+        # objects that fake their class, e.g., mocks.
+        klass = accessible.__class__
+        adder = self._ACCESSIBLE_ADDERS.get(klass)
+        if adder is None:
+            # Not one of the known kinds itself, but it might be a subclass of one.
+            adder = next(
+                (
+                    self._ACCESSIBLE_ADDERS[base]
+                    for base in klass.__mro__
+                    if base in self._ACCESSIBLE_ADDERS
+                ),
+                None,
             )
-        if isinstance(accessible, gao.GenericFunction):
-            return self.add_function(
+            if adder is None:
+                raise ConstructionFailedException(
+                    f"Unknown accessible type: {accessible}"
+                )
+        method_name, supports_none = adder
+        if supports_none:
+            return getattr(self, method_name)(
                 test_case,
                 accessible,
                 position=new_position,
                 allow_none=allow_none,
                 recursion_depth=recursion_depth,
             )
-        if isinstance(accessible, gao.GenericField):
-            return self.add_field(
-                test_case,
-                accessible,
-                position=new_position,
-                recursion_depth=recursion_depth,
-            )
-        if isinstance(accessible, gao.GenericEnum):
-            return self.add_enum(
-                test_case,
-                accessible,
-                position=new_position,
-                recursion_depth=recursion_depth,
-            )
-        raise ConstructionFailedException(f"Unknown accessible type: {accessible}")
+        return getattr(self, method_name)(
+            test_case,
+            accessible,
+            position=new_position,
+            recursion_depth=recursion_depth,
+        )
 
     def add_constructor(
         self,
@@ -211,16 +216,16 @@ class TestFactory:
         Raises:
             ConstructionFailedException: if construction of an object failed
         """
-        self._logger.debug("Adding constructor %s", constructor)
         if recursion_depth > config.configuration.test_creation.max_recursion:
             self._logger.debug("Max recursion depth reached")
             raise ConstructionFailedException("Max recursion depth reached")
+        self._logger.debug("Adding constructor %s", constructor)
 
+        length = test_case.size()
         if position < 0:
-            position = test_case.size()
+            position = length
 
         signature = constructor.inferred_signature
-        length = test_case.size()
         try:
             parameters: dict[str, vr.VariableReference] = self.satisfy_parameters(
                 test_case=test_case,
@@ -238,7 +243,9 @@ class TestFactory:
                 args=parameters,
             )
             return test_case.add_variable_creating_statement(statement, position)
-        except BaseException as exception:
+        # ConstructionFailedException is not an Exception, so it must be listed
+        # explicitly; interrupts and timeouts are left alone.
+        except (ConstructionFailedException, Exception) as exception:
             raise ConstructionFailedException(
                 f"Failed to add constructor for {constructor}"
             ) from exception
@@ -273,16 +280,16 @@ class TestFactory:
         Raises:
             ConstructionFailedException: if construction of an object failed
         """
-        self._logger.debug("Adding method %s", method)
         if recursion_depth > config.configuration.test_creation.max_recursion:
             self._logger.debug("Max recursion depth reached")
             raise ConstructionFailedException("Max recursion depth reached")
+        self._logger.debug("Adding method %s", method)
 
+        length = test_case.size()
         if position < 0:
-            position = test_case.size()
+            position = length
 
         signature = method.inferred_signature
-        length = test_case.size()
         if callee is None:
             callee = self._create_or_reuse_variable(
                 test_case,
@@ -291,7 +298,10 @@ class TestFactory:
                 recursion_depth,
                 allow_none=False,
             )
-        assert callee, "The callee must not be None"
+            if callee is None:
+                raise ConstructionFailedException(
+                    f"Failed to create callee for method {method}"
+                )
         parameters: dict[str, vr.VariableReference] = self.satisfy_parameters(
             test_case=test_case,
             signature=signature,
@@ -339,15 +349,15 @@ class TestFactory:
         Raises:
             ConstructionFailedException: if construction of an object failed
         """
-        self._logger.debug("Adding field %s", field)
         if recursion_depth > config.configuration.test_creation.max_recursion:
             self._logger.debug("Max recursion depth reached")
             raise ConstructionFailedException("Max recursion depth reached")
+        self._logger.debug("Adding field %s", field)
 
+        length = test_case.size()
         if position < 0:
-            position = test_case.size()
+            position = length
 
-        length = test_case.size()
         if callee is None:
             callee = self._create_or_reuse_variable(
                 test_case,
@@ -356,7 +366,10 @@ class TestFactory:
                 recursion_depth,
                 allow_none=False,
             )
-        assert callee, "The callee must not be None"
+            if callee is None:
+                raise ConstructionFailedException(
+                    f"Failed to create callee for field {field}"
+                )
         position = position + test_case.size() - length
         statement = stmt.FieldStatement(test_case, field, callee)
         return test_case.add_variable_creating_statement(statement, position)
@@ -387,10 +400,10 @@ class TestFactory:
         Raises:
             ConstructionFailedException: if construction of an object failed
         """
-        self._logger.debug("Adding enum %s", enum_)
         if recursion_depth > config.configuration.test_creation.max_recursion:
             self._logger.debug("Max recursion depth reached")
             raise ConstructionFailedException("Max recursion depth reached")
+        self._logger.debug("Adding enum %s", enum_)
 
         if position < 0:
             position = test_case.size()
@@ -426,16 +439,16 @@ class TestFactory:
         Raises:
             ConstructionFailedException: if construction of an object failed
         """
-        self._logger.debug("Adding function %s", function)
         if recursion_depth > config.configuration.test_creation.max_recursion:
             self._logger.debug("Max recursion depth reached")
             raise ConstructionFailedException("Max recursion depth reached")
+        self._logger.debug("Adding function %s", function)
 
+        length = test_case.size()
         if position < 0:
-            position = test_case.size()
+            position = length
 
         signature = function.inferred_signature
-        length = test_case.size()
         parameters: dict[str, vr.VariableReference] = self.satisfy_parameters(
             test_case=test_case,
             signature=signature,
@@ -504,8 +517,8 @@ class TestFactory:
         else:
             success = self.insert_random_call_on_object(test_case, position)
 
-        if test_case.size() - old_size > 1:
-            position += test_case.size() - old_size - 1
+        if (size_difference := test_case.size() - old_size) > 1:
+            position += size_difference - 1
         if success:
             return position
         return -1
@@ -679,11 +692,13 @@ class TestFactory:
 
         changed = False
         if variable is not None:
+            random_object_probability = (
+                config.configuration.test_creation.use_random_object_for_call
+            )
             for i in range(position + 1, test_case.size()):
                 typ = (
                     ANY
-                    if randomness.next_float()
-                    < config.configuration.test_creation.use_random_object_for_call
+                    if randomness.next_float() < random_object_probability
                     else variable.type
                 )
                 alternatives = test_case.get_objects(typ, i)
@@ -853,13 +868,15 @@ class TestFactory:
             A dict of existing objects
         """
         found = {}
+        skip_probability = (
+            config.configuration.test_creation.skip_optional_parameter_probability
+        )
         for parameter_name, parameter_type in inf_signature.get_parameter_types(
             signature_memo
         ).items():
             if (
                 is_optional_parameter(inf_signature, parameter_name)
-                and randomness.next_float()
-                < config.configuration.test_creation.skip_optional_parameter_probability
+                and randomness.next_float() < skip_probability
             ):
                 continue
             found[parameter_name] = test_case.get_random_object(
@@ -906,10 +923,13 @@ class TestFactory:
         Returns:
             Whether the objects are sufficient to satisfy the dependencies
         """
+        # Resolve the subtype check only once, the cluster might be a wrapper that
+        # delegates every access to the type system.
+        is_maybe_subtype = self._test_cluster.type_system.is_maybe_subtype
         for type_ in dependencies:
             found = False
             for var in objects:
-                if self._test_cluster.type_system.is_maybe_subtype(var.type, type_):
+                if is_maybe_subtype(var.type, type_):
                     found = True
                     break
             if not found:
@@ -939,34 +959,48 @@ class TestFactory:
         Raises:
             ConstructionFailedException: if construction of an object failed
         """
+        previous_length = test_case.size()
         if position < 0:
-            position = test_case.size()
+            position = previous_length
 
         parameters: dict[str, vr.VariableReference] = {}
-        self._logger.debug(
-            "Trying to satisfy %d parameters at position %d",
-            len(signature.original_parameters),
-            position,
+        # This is called for every single statement that is added, so avoid the
+        # logging overhead per parameter if debug output is disabled anyway.
+        debug = self._logger.isEnabledFor(logging.DEBUG)
+        skip_probability = (
+            config.configuration.test_creation.skip_optional_parameter_probability
         )
+        if debug:
+            self._logger.debug(
+                "Trying to satisfy %d parameters at position %d",
+                len(signature.original_parameters),
+                position,
+            )
 
+        # Candidates for reuse per parameter type.  They stay valid as long as no
+        # statement was inserted, because the position does not change either;
+        # this spares a scan of the test case for parameters of the same type.
+        candidates: dict[ProperType, list[vr.VariableReference]] = {}
         for parameter_name, parameter_type in signature.get_parameter_types({}).items():
-            self._logger.debug("Current parameter type: %s", parameter_type)
-
-            previous_length = test_case.size()
+            if debug:
+                self._logger.debug("Current parameter type: %s", parameter_type)
 
             if (
                 is_optional_parameter(signature, parameter_name)
-                and randomness.next_float()
-                < config.configuration.test_creation.skip_optional_parameter_probability
+                and randomness.next_float() < skip_probability
             ):
                 continue
 
+            if (objects := candidates.get(parameter_type)) is None:
+                objects = test_case.get_objects(parameter_type, position)
+                candidates[parameter_type] = objects
             var = self._create_or_reuse_variable(
                 test_case,
                 parameter_type,
                 position,
                 recursion_depth,
                 allow_none,
+                objects,
             )
 
             if not var:
@@ -979,31 +1013,36 @@ class TestFactory:
 
             parameters[parameter_name] = var
             current_length = test_case.size()
-            position += current_length - previous_length
+            if current_length != previous_length:
+                position += current_length - previous_length
+                previous_length = current_length
+                candidates.clear()
 
-        self._logger.debug("Satisfied %d parameters", len(parameters))
+        if debug:
+            self._logger.debug("Satisfied %d parameters", len(parameters))
         return parameters
 
     def _reuse_variable(
-        self, test_case: tc.TestCase, parameter_type: ProperType, position: int
+        self, parameter_type: ProperType, objects: list[vr.VariableReference]
     ) -> vr.VariableReference | None:
         """Reuse an existing variable, if possible.
 
         Args:
-            test_case: the test case to take the variable from
             parameter_type: the type of the variable that is needed
-            position: the position to limit the search
+            objects: the existing variables that satisfy the type
 
         Returns:
             A matching existing variable, if existing
         """
-        objects = test_case.get_objects(parameter_type, position)
+        if not objects:
+            return None
+        test_creation = config.configuration.test_creation
         probability: float = (
-            config.configuration.test_creation.primitive_reuse_probability
+            test_creation.primitive_reuse_probability
             if parameter_type.accept(is_primitive_type)
-            else config.configuration.test_creation.object_reuse_probability
+            else test_creation.object_reuse_probability
         )
-        if objects and randomness.next_float() <= probability:
+        if randomness.next_float() <= probability:
             var = randomness.choice(objects)
             self._logger.debug("Reusing variable %s for type %s", var, parameter_type)
             return var
@@ -1013,6 +1052,7 @@ class TestFactory:
         self,
         test_case: tc.TestCase,
         parameter_type: ProperType,
+        objects: list[vr.VariableReference],
         position: int,
         recursion_depth: int,
         allow_none: bool,
@@ -1022,6 +1062,7 @@ class TestFactory:
         Args:
             test_case: The test case to take the variable from
             parameter_type: the type of the variable that is needed
+            objects: the existing variables that satisfy the type
             position: the position to limit the search
             recursion_depth: the current recursion level
             allow_none: whether a None value is allowed
@@ -1032,8 +1073,6 @@ class TestFactory:
         Raises:
             ConstructionFailedException: if construction of an object failed
         """
-        objects = test_case.get_objects(parameter_type, position)
-
         # No objects to choose from, so either create random type variable or use None.
         if not objects:
             if randomness.next_float() <= 0.85:
@@ -1067,9 +1106,14 @@ class TestFactory:
         position: int,
         recursion_depth: int,
         allow_none: bool,
+        objects: list[vr.VariableReference] | None = None,
     ) -> vr.VariableReference | None:
+        # The candidates stay valid for the fallback, because a failed generation
+        # attempt does not add any statements to the test case.
+        if objects is None:
+            objects = test_case.get_objects(parameter_type, position)
         if (
-            reused_variable := self._reuse_variable(test_case, parameter_type, position)
+            reused_variable := self._reuse_variable(parameter_type, objects)
         ) is not None:
             return reused_variable
         if (
@@ -1083,7 +1127,7 @@ class TestFactory:
         ) is not None:
             return created_variable
         return self._get_variable_fallback(
-            test_case, parameter_type, position, recursion_depth, allow_none
+            test_case, parameter_type, objects, position, recursion_depth, allow_none
         )
 
     def _attempt_generation(
@@ -1094,9 +1138,10 @@ class TestFactory:
         recursion_depth: int,
         allow_none: bool,
     ) -> vr.VariableReference | None:
+        test_cluster = self._test_cluster
         # We only select a concrete type e.g. from a union, when we are forced to
         # choose one.
-        parameter_type = self._test_cluster.select_concrete_type(parameter_type)
+        parameter_type = test_cluster.select_concrete_type(parameter_type)
 
         if isinstance(parameter_type, NoneType):
             return self._create_none(test_case, position, recursion_depth)
@@ -1116,9 +1161,7 @@ class TestFactory:
                 position,
                 recursion_depth,
             )
-        type_generators, only_any = self._test_cluster.get_generators_for(
-            parameter_type
-        )
+        type_generators, only_any = test_cluster.get_generators_for(parameter_type)
         if type_generators and not only_any:
             type_generator = randomness.choice(type_generators)
             return self.append_generic_accessible(
@@ -1138,9 +1181,7 @@ class TestFactory:
     ) -> vr.VariableReference:
         # If there already is a None alias just return it.
         # TODO(fk) better way?
-        for statement in test_case.statements[
-            : min(len(test_case.statements), position)
-        ]:
+        for statement in islice(test_case.statements, position):
             if isinstance(statement, stmt.NoneStatement):
                 return statement.ret_val
 
@@ -1300,12 +1341,12 @@ class TestFactory:
             key = self._create_or_reuse_variable(
                 test_case, key_type, position, recursion_depth + 1, True
             )
-            position += test_case.size() - previous_length
-            previous_length = test_case.size()
+            current_length = test_case.size()
+            position += current_length - previous_length
             value = self._create_or_reuse_variable(
                 test_case, value_type, position, recursion_depth + 1, True
             )
-            position += test_case.size() - previous_length
+            position += test_case.size() - current_length
             if key is not None and value is not None:
                 elements.append((key, value))
 
@@ -35,6 +35,8 @@ class Reference(metaclass=ABCMeta):
     Here, foo_0, int_0 and foo_0.bar are references.
     """
 
+    __slots__ = ("_type",)
+
     def __init__(self, typ: ProperType) -> None:
         """Constructs a new reference.
 
@@ -154,6 +156,8 @@ class VariableReference(Reference):
     to check for equality. The other reference do implement eq/hash.
     """
 
+    __slots__ = ("_test_case", "_distance", "_position_cache")
+
     def __init__(self, test_case: tc.TestCase, typ: ProperType):
         """Constructs a new variable reference.
 
@@ -164,6 +168,9 @@ class VariableReference(Reference):
         super().__init__(typ)
         self._test_case = test_case
         self._distance = 0
+        # Index at which this variable was last found in the test case.  Only a hint,
+        # it is validated on every lookup as statements may be inserted or removed.
+        self._position_cache = 0
 
     @property
     def test_case(self) -> tc.TestCase:
@@ -228,8 +235,13 @@ class VariableReference(Reference):
         Returns:
             The position  # noqa: DAR202
         """
-        for idx, stmt in enumerate(self._test_case.statements):
-            if stmt.ret_val == self:
+        statements = self._test_case.statements
+        idx = self._position_cache
+        if idx < len(statements) and statements[idx].ret_val is self:
+            return idx
+        for idx, stmt in enumerate(statements):
+            if stmt.ret_val is self:
+                self._position_cache = idx
                 return idx
         raise RuntimeError(
             "Variable reference is not declared in the test case in which it is used"
@@ -265,6 +277,8 @@ class CallBasedVariableReference(VariableReference):
 
     """
 
+    __slots__ = ("_callable",)
+
     def __init__(
         self,
         test_case: tc.TestCase,
@@ -299,6 +313,8 @@ class CallBasedVariableReference(VariableReference):
 class FieldReference(Reference):
     """A reference to a non-static field."""
 
+    __slots__ = ("_source", "_field")
+
     def __init__(self, source: Reference, field: gao.GenericField):
         """Constructs a new reference to a non-static field.
 
@@ -377,6 +393,8 @@ class FieldReference(Reference):
 class StaticFieldReference(Reference):
     """A reference to a static field of a class."""
 
+    __slots__ = ("_field", "_hash")
+
     def __init__(self, field: gao.GenericStaticField):
         """Constructs a new reference to a static field of a class.
 
@@ -385,6 +403,8 @@ class StaticFieldReference(Reference):
         """
         super().__init__(field.generated_type())
         self._field = field
+        # The field cannot be replaced, so its hash never changes.
+        self._hash = hash(field)
 
     @property
     def field(self) -> gao.GenericStaticField:
@@ -420,13 +440,13 @@ class StaticFieldReference(Reference):
         return self._field == other._field
 
     def structural_hash(self, memo: dict[VariableReference, int]) -> int:  # noqa: D102
-        return hash(self._field)
+        return self._hash
 
     def __eq__(self, other):
         return self.structural_eq(other, {})
 
     def __hash__(self):
-        return self.structural_hash({})
+        return self._hash
 
     def get_variable_reference(self) -> VariableReference | None:  # noqa: D102
         return None
@@ -440,6 +460,8 @@ class StaticFieldReference(Reference):
 class StaticModuleFieldReference(Reference):
     """A reference to a static module field."""
 
+    __slots__ = ("_field", "_hash")
+
     # TODO(fk) combine with regular static field?
 
     def __init__(self, field: gao.GenericStaticModuleField):
@@ -450,6 +472,8 @@ class StaticModuleFieldReference(Reference):
         """
         super().__init__(field.generated_type())
         self._field = field
+        # The field cannot be replaced, so its hash never changes.
+        self._hash = hash(field)
 
     @property
     def field(self) -> gao.GenericStaticModuleField:
@@ -480,13 +504,13 @@ class StaticModuleFieldReference(Reference):
         return self._field == other._field
 
     def structural_hash(self, memo: dict[VariableReference, int]) -> int:  # noqa: D102
-        return hash(self._field)
+        return self._hash
 
     def __eq__(self, other):
         return self.structural_eq(other, {})
 
     def __hash__(self):
-        return self.structural_hash({})
+        return self._hash
 
     def get_variable_reference(self) -> VariableReference | None:  # noqa: D102
         return None
@@ -79,8 +79,10 @@ class _AbstractOrderedSet(Set[T], Sequence[T]):
         """
         if isinstance(index, slice):
             raise NotImplementedError("Slicing currently not supported.")
-        for i, key in enumerate(self._items.keys()):
-            if i == index:
+        if index >= 0:
+            # Let islice skip the leading keys, which is much faster than counting
+            # them in a Python loop.
+            for key in itertools.islice(self._items, index, None):
                 return key
         raise IndexError("Index out of range.")
 
@@ -58,6 +58,18 @@ def parsed_module_nested_functions() -> _ModuleParseResult:
     return parse_module("tests.fixtures.cluster.nested_functions")
 
 
+@pytest.fixture(scope="module")
+def inheritance_test_cluster() -> ModuleTestCluster:
+    # Only for tests that do not modify the cluster.
+    return generate_test_cluster("tests.fixtures.cluster.inheritance")
+
+
+@pytest.fixture(scope="module")
+def attributes_test_cluster() -> ModuleTestCluster:
+    # Only for tests that do not modify the cluster.
+    return generate_test_cluster("tests.fixtures.cluster.attributes")
+
+
 @pytest.fixture
 def module_test_cluster() -> ModuleTestCluster:
     return ModuleTestCluster(linenos=-1)
@@ -333,8 +345,8 @@ def test_complex_dependencies():
     assert cluster.num_accessible_objects_under_test() == 1
 
 
-def test_inheritance_generator():
-    cluster = generate_test_cluster("tests.fixtures.cluster.inheritance")
+def test_inheritance_generator(inheritance_test_cluster):
+    cluster = inheritance_test_cluster
     from tests.fixtures.cluster.inheritance import Bar
     from tests.fixtures.cluster.inheritance import Foo
 
@@ -379,8 +391,31 @@ def test_only_any_generator_3(module_test_cluster):
     ) == (OrderedSet([generator, generator2]), False)
 
 
-def test_inheritance_modifier():
-    cluster = generate_test_cluster("tests.fixtures.cluster.inheritance")
+def test_generators_for_follow_updated_return_type(module_test_cluster, function_mock):
+    int_type = module_test_cluster.type_system.convert_type_hint(int)
+    # Dead ends are memoised, but must not outlive a change of the return types.
+    assert module_test_cluster.get_generators_for(int_type) == (OrderedSet(), True)
+    module_test_cluster.update_return_type(function_mock, int_type)
+    assert module_test_cluster.get_generators_for(int_type) == (
+        OrderedSet([function_mock]),
+        False,
+    )
+
+
+def test_generators_for_follow_added_generator(module_test_cluster):
+    typ = module_test_cluster.type_system.convert_type_hint(MagicMock)
+    assert module_test_cluster.get_generators_for(typ) == (OrderedSet(), True)
+    generator = MagicMock(GenericMethod)
+    generator.generated_type.return_value = typ
+    module_test_cluster.add_generator(generator)
+    assert module_test_cluster.get_generators_for(typ) == (
+        OrderedSet([generator]),
+        False,
+    )
+
+
+def test_inheritance_modifier(inheritance_test_cluster):
+    cluster = inheritance_test_cluster
     from tests.fixtures.cluster.inheritance import Bar
     from tests.fixtures.cluster.inheritance import Foo
 
@@ -506,8 +541,8 @@ def test_no_abstract_class():
     assert len(cluster.modifiers) == 1
 
 
-def test_inheritance_graph():
-    cluster = generate_test_cluster("tests.fixtures.cluster.inheritance")
+def test_inheritance_graph(inheritance_test_cluster):
+    cluster = inheritance_test_cluster
     assert (
         len(cluster.type_system.get_subclasses(TypeInfo(object)))
         == len(COLLECTIONS) + len(PRIMITIVES) + 3  # Foo, Bar, object.
@@ -515,20 +550,18 @@ def test_inheritance_graph():
 
 
 @pytest.mark.parametrize(
-    "mod,typ,attributes",
+    "typ,attributes",
     [
-        ("tests.fixtures.cluster.attributes", "SomeClass", OrderedSet(["foo", "bar"])),
-        (
-            "tests.fixtures.cluster.attributes",
-            "SomeDataClass",
-            OrderedSet(["baz", "box"]),
-        ),
+        ("SomeClass", OrderedSet(["foo", "bar"])),
+        ("SomeDataClass", OrderedSet(["baz", "box"])),
     ],
 )
-def test_instance_attrs(mod, typ, attributes):
-    cluster = generate_test_cluster(mod)
+def test_instance_attrs(attributes_test_cluster, typ, attributes):
+    cluster = attributes_test_cluster
     assert (
-        cluster.type_system.find_type_info(f"{mod}.{typ}").instance_attributes
+        cluster.type_system.find_type_info(
+            f"tests.fixtures.cluster.attributes.{typ}"
+        ).instance_attributes
         == attributes
     )
 
@@ -284,6 +284,15 @@ def test_convert_type_hint_unsupported(hint, expected):
     ts.convert_type_hint(hint, unsupported=UNSUPPORTED)
 
 
+def test_convert_union_type_hint_cached():
+    ts = TypeSystem()
+    first = ts.convert_type_hint(int | str)
+    assert ts.convert_type_hint(int | str) is first
+    assert ts.convert_type_hint(int | A) != ts.convert_type_hint(
+        int | A, unsupported=UNSUPPORTED
+    )
+
+
 def test_unsupported_str():
     assert str(UNSUPPORTED) == "<?>"
 
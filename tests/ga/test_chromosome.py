@@ -4,8 +4,6 @@
 #
 #  SPDX-License-Identifier: MIT
 #
-from unittest.mock import MagicMock
-
 import pytest
 
 import pynguin.ga.chromosome as chrom
@@ -55,11 +53,20 @@ def test_has_changed(chromosome):
     assert not chromosome.changed
 
 
+class _MinimisingFitnessFunction(ff.FitnessFunction):
+    def compute_fitness(self, individual) -> float:
+        return 0.0  # pragma: no cover
+
+    def compute_is_covered(self, individual) -> bool:
+        return True  # pragma: no cover
+
+    def is_maximisation_function(self) -> bool:
+        return False
+
+
 def test_get_fitness_functions(chromosome):
-    func1 = MagicMock(ff.FitnessFunction)
-    func1.is_maximisation_function.return_value = False
-    func2 = MagicMock(ff.FitnessFunction)
-    func2.is_maximisation_function.return_value = False
+    func1 = _MinimisingFitnessFunction()
+    func2 = _MinimisingFitnessFunction()
     chromosome.add_fitness_function(func1)
     chromosome.add_fitness_function(func2)
     assert chromosome.get_fitness_functions() == [func1, func2]
@@ -33,9 +33,15 @@ from pynguin.utils.generic.genericaccessibleobject import GenericMethod
 from tests.fixtures.linecoverage.setter_getter import SetterGetter
 
 
+@pytest.fixture(scope="module")
+def plus_test_cluster():
+    # The tests only read from the cluster, so analyse the module just once.
+    return generate_test_cluster("tests.fixtures.linecoverage.plus")
+
+
 @pytest.fixture
-def plus_three_test():
-    cluster = generate_test_cluster("tests.fixtures.linecoverage.plus")
+def plus_three_test(plus_test_cluster):
+    cluster = plus_test_cluster
     transformer = AstToTestCaseTransformer(cluster, False, EmptyConstantProvider())
     transformer.visit(
         ast.parse(
@@ -4,6 +4,8 @@
 #
 #  SPDX-License-Identifier: MIT
 #
+import dataclasses
+
 from pathlib import Path
 from unittest import mock
 from unittest.mock import MagicMock
@@ -18,29 +20,35 @@ import pynguin.generator as gen
 from pynguin.utils.statistics.runtimevariable import RuntimeVariable
 
 
+def _configuration(**changes) -> config.Configuration:
+    # A copy of the default test configuration is much cheaper than a mock and
+    # only provides attributes that actually exist.
+    return dataclasses.replace(config.configuration, **changes)
+
+
 def test_init_with_configuration():
-    conf = MagicMock(log_file=None)
+    conf = _configuration()
     gen.set_configuration(configuration=conf)
-    assert config.configuration == conf
+    assert config.configuration is conf
 
 
 def test__load_sut_failed():
     gen.set_configuration(
-        configuration=MagicMock(log_file=None, module_name="this.does.not.exist")
+        configuration=_configuration(module_name="this.does.not.exist")
     )
     assert gen._load_sut(MagicMock()) is False
 
 
 def test__load_sut_success():
-    gen.set_configuration(configuration=MagicMock(log_file=None))
+    gen.set_configuration(configuration=_configuration())
     with mock.patch("importlib.import_module"):
         assert gen._load_sut(MagicMock())
 
 
 def test_setup_test_cluster_empty():
     gen.set_configuration(
-        configuration=MagicMock(
-            type_inference=MagicMock(
+        configuration=_configuration(
+            type_inference=config.TypeInferenceConfiguration(
                 type_inference_strategy=config.TypeInferenceStrategy.TYPE_HINTS
             ),
         )
@@ -54,8 +62,8 @@ def test_setup_test_cluster_empty():
 
 def test_setup_test_cluster_not_empty():
     gen.set_configuration(
-        configuration=MagicMock(
-            type_inference=MagicMock(
+        configuration=_configuration(
+            type_inference=config.TypeInferenceConfiguration(
                 type_inference_strategy=config.TypeInferenceStrategy.TYPE_HINTS
             ),
         )
@@ -68,18 +76,14 @@ def test_setup_test_cluster_not_empty():
 
 
 def test_setup_path_invalid_dir(tmp_path):
-    gen.set_configuration(
-        configuration=MagicMock(log_file=None, project_path=tmp_path / "nope")
-    )
+    gen.set_configuration(configuration=_configuration(project_path=tmp_path / "nope"))
     assert gen._setup_path() is False
 
 
 def test_setup_path_valid_dir(tmp_path):
     module_name = "test_module"
     gen.set_configuration(
-        configuration=MagicMock(
-            log_file=None, project_path=tmp_path, module_name=module_name
-        )
+        configuration=_configuration(project_path=tmp_path, module_name=module_name)
     )
     with mock.patch("sys.path") as path_mock:
         assert gen._setup_path() is True
@@ -88,9 +92,7 @@ def test_setup_path_valid_dir(tmp_path):
 
 def test_setup_hook():
     module_name = "test_module"
-    gen.set_configuration(
-        configuration=MagicMock(log_file=None, module_name=module_name)
-    )
+    gen.set_configuration(configuration=_configuration(module_name=module_name))
     with mock.patch.object(gen, "install_import_hook") as hook_mock:
         assert gen._setup_import_hook(None, None)
         hook_mock.assert_called_once()
@@ -187,9 +189,7 @@ def test__setup_report_dir_not_required(tmp_path: Path):
 
 
 def test_run(tmp_path):
-    gen.set_configuration(
-        configuration=MagicMock(log_file=None, project_path=tmp_path / "nope")
-    )
+    gen.set_configuration(configuration=_configuration(project_path=tmp_path / "nope"))
     with mock.patch("pynguin.generator._run") as run_mock:
         gen.run_pynguin()
         run_mock.assert_called_once()
@@ -28,6 +28,13 @@ def get_default_test_case():
     return dtc.DefaultTestCase(ModuleTestCluster(0))
 
 
+@pytest.fixture(scope="module")
+def statement_mocks():
+    # Only compared by identity, so they can be shared between the tests that
+    # merely move statements around.
+    return tuple(MagicMock(st.Statement) for _ in range(3))
+
+
 def test_add_statement_end(default_test_case):
     stmt_1 = MagicMock(st.Statement, ret_val=MagicMock())
     stmt_2 = MagicMock(st.Statement, ret_val=MagicMock())
@@ -52,24 +59,6 @@ def test_add_statement_middle(default_test_case):
     assert default_test_case._statements == [stmt_1, stmt_2, stmt_3]
 
 
-def test_add_statements(default_test_case):
-    stmt_1 = MagicMock(st.Statement)
-    stmt_2 = MagicMock(st.Statement)
-    stmt_3 = MagicMock(st.Statement)
-    default_test_case._statements.append(stmt_1)
-    default_test_case.add_statements([stmt_2, stmt_3])
-    assert default_test_case._statements == [stmt_1, stmt_2, stmt_3]
-
-
-def test_chop(default_test_case):
-    stmt_1 = MagicMock(st.Statement)
-    stmt_2 = MagicMock(st.Statement)
-    stmt_3 = MagicMock(st.Statement)
-    default_test_case._statements.extend([stmt_1, stmt_2, stmt_3])
-    default_test_case.chop(1)
-    assert default_test_case._statements == [stmt_1, stmt_2]
-
-
 def test_contains_true(default_test_case):
     stmt = MagicMock(st.Statement)
     default_test_case._statements.append(stmt)
@@ -80,41 +69,49 @@ def test_contains_false(default_test_case):
     assert not default_test_case.contains(MagicMock(st.Statement))
 
 
-def test_size(default_test_case):
-    stmt_1 = MagicMock(st.Statement)
-    stmt_2 = MagicMock(st.Statement)
-    stmt_3 = MagicMock(st.Statement)
+def test_size(default_test_case, statement_mocks):
+    stmt_1, stmt_2, stmt_3 = statement_mocks
     default_test_case._statements.extend([stmt_1, stmt_2, stmt_3])
     assert default_test_case.size() == 3
 
 
-def test_remove_nothing(default_test_case):
-    default_test_case.remove(1)
-
-
-def test_remove(default_test_case):
-    stmt_1 = MagicMock(st.Statement)
-    stmt_2 = MagicMock(st.Statement)
-    stmt_3 = MagicMock(st.Statement)
-    default_test_case._statements.extend([stmt_1, stmt_2, stmt_3])
-    default_test_case.remove(1)
-    assert default_test_case._statements == [stmt_1, stmt_3]
-
-
-def test_remove_statement(default_test_case):
-    stmt_1 = MagicMock(st.Statement)
-    stmt_2 = MagicMock(st.Statement)
-    stmt_3 = MagicMock(st.Statement)
-    default_test_case.add_statements([stmt_1, stmt_2, stmt_3])
-    assert default_test_case.size() == 3
-    default_test_case.remove_statement(stmt_2)
-    assert default_test_case.statements == [stmt_1, stmt_3]
+@pytest.mark.parametrize(
+    "initial,modify,expected",
+    [
+        pytest.param(
+            (0,),
+            lambda test_case, stmts: test_case.add_statements([stmts[1], stmts[2]]),
+            (0, 1, 2),
+            id="add_statements",
+        ),
+        pytest.param(
+            (0, 1, 2), lambda test_case, _: test_case.chop(1), (0, 1), id="chop"
+        ),
+        pytest.param(
+            (), lambda test_case, _: test_case.remove(1), (), id="remove-empty"
+        ),
+        pytest.param(
+            (0, 1, 2), lambda test_case, _: test_case.remove(1), (0, 2), id="remove"
+        ),
+        pytest.param(
+            (0, 1, 2),
+            lambda test_case, stmts: test_case.remove_statement(stmts[1]),
+            (0, 2),
+            id="remove_statement",
+        ),
+    ],
+)
+def test_modify_statements(
+    default_test_case, statement_mocks, initial, modify, expected
+):
+    default_test_case.add_statements([statement_mocks[i] for i in initial])
+    assert default_test_case.size() == len(initial)
+    modify(default_test_case, statement_mocks)
+    assert default_test_case.statements == [statement_mocks[i] for i in expected]
 
 
-def test_get_statement(default_test_case):
-    stmt_1 = MagicMock(st.Statement)
-    stmt_2 = MagicMock(st.Statement)
-    stmt_3 = MagicMock(st.Statement)
+def test_get_statement(default_test_case, statement_mocks):
+    stmt_1, stmt_2, stmt_3 = statement_mocks
     default_test_case._statements.extend([stmt_1, stmt_2, stmt_3])
     assert default_test_case.get_statement(1) == stmt_2
 
@@ -129,10 +126,8 @@ def test_get_statement_positive_position(default_test_case):
         default_test_case.get_statement(42)
 
 
-def test_has_statement(default_test_case):
-    stmt_1 = MagicMock(st.Statement)
-    stmt_2 = MagicMock(st.Statement)
-    stmt_3 = MagicMock(st.Statement)
+def test_has_statement(default_test_case, statement_mocks):
+    stmt_1, stmt_2, stmt_3 = statement_mocks
     default_test_case._statements.extend([stmt_1, stmt_2, stmt_3])
     assert not default_test_case.has_statement(-1)
     assert default_test_case.has_statement(1)
@@ -158,44 +153,43 @@ def test_eq_same(default_test_case):
     assert default_test_case == default_test_case
 
 
-def test_eq_statements_1(default_test_case):
-    other = dtc.DefaultTestCase(ModuleTestCluster(0))
-    other._statements = [MagicMock(st.Statement)]
-    assert default_test_case != other
-
-
-def test_eq_statements_2(default_test_case):
-    default_test_case._statements = [MagicMock(st.Statement)]
-    other = dtc.DefaultTestCase(ModuleTestCluster(0))
-    other._statements = [MagicMock(st.Statement), MagicMock(st.Statement)]
-    assert default_test_case != other
-
-
-def test_eq_statements_3(default_test_case):
+def _structurally_different_statements():
     stmt1 = MagicMock(ret_val=MagicMock())
     stmt1.structural_eq.return_value = False
-    default_test_case._statements = [stmt1]
-    other = dtc.DefaultTestCase(ModuleTestCluster(0))
-    other._statements = [MagicMock(st.Statement, ret_val=MagicMock())]
-    assert default_test_case != other
+    return [stmt1], [MagicMock(st.Statement, ret_val=MagicMock())]
 
 
-def test_eq_statements_4(default_test_case):
+def _shared_statements():
     statements = [
         MagicMock(st.Statement, ret_val=MagicMock()),
         MagicMock(st.Statement, ret_val=MagicMock()),
     ]
-    default_test_case._statements = statements
-    other = dtc.DefaultTestCase(ModuleTestCluster(0))
-    other._statements = statements
-    assert default_test_case.__eq__(other)
+    return statements, statements
 
 
-def test_eq_statements_5(default_test_case):
-    default_test_case._statements = []
-    other = dtc.DefaultTestCase(ModuleTestCluster(0))
-    other._statements = []
-    assert default_test_case.__eq__(other)
+@pytest.mark.parametrize(
+    "make_statements,result",
+    [
+        pytest.param(lambda: ([], [MagicMock(st.Statement)]), False, id="empty-one"),
+        pytest.param(
+            lambda: (
+                [MagicMock(st.Statement)],
+                [MagicMock(st.Statement), MagicMock(st.Statement)],
+            ),
+            False,
+            id="one-two",
+        ),
+        pytest.param(_structurally_different_statements, False, id="different"),
+        pytest.param(_shared_statements, True, id="shared"),
+        pytest.param(lambda: ([], []), True, id="empty-empty"),
+    ],
+)
+def test_eq_statements(default_test_case, make_statements, result):
+    statements, other_statements = make_statements()
+    default_test_case._statements = statements
+    other = dtc.DefaultTestCase(default_test_case.test_cluster)
+    other._statements = other_statements
+    assert default_test_case.__eq__(other) == result
 
 
 def test_clone(default_test_case):
@@ -225,20 +219,12 @@ def test_append_test_case(default_test_case):
 
 
 def test_get_objects(default_test_case, type_system):
-    stmt_1 = MagicMock(st.Statement)
-    vri_1 = vr.VariableReference(default_test_case, type_system.convert_type_hint(int))
-    stmt_1.ret_val = vri_1
-    stmt_2 = MagicMock(st.Statement)
-    vri_2 = vr.VariableReference(
-        default_test_case, type_system.convert_type_hint(float)
-    )
-    stmt_2.ret_val = vri_2
-    stmt_3 = MagicMock(st.Statement)
-    vri_3 = vr.VariableReference(default_test_case, type_system.convert_type_hint(int))
-    stmt_3.ret_val = vri_3
-    default_test_case._statements = [stmt_1, stmt_2, stmt_3]
+    int0 = st.IntPrimitiveStatement(default_test_case, 5)
+    float0 = st.FloatPrimitiveStatement(default_test_case, 5.5)
+    int1 = st.IntPrimitiveStatement(default_test_case, 5)
+    default_test_case.add_statements([int0, float0, int1])
     result = default_test_case.get_objects(type_system.convert_type_hint(int), 2)
-    assert result == [vri_1]
+    assert result == [int0.ret_val]
 
 
 def test_get_objects_without_type(default_test_case):
@@ -88,6 +88,7 @@ def test_append_statement(test_case_mock, statement):
         (MagicMock(gao.GenericMethod)),
         (MagicMock(gao.GenericFunction)),
         (MagicMock(gao.GenericField)),
+        (MagicMock(gao.GenericEnum)),
     ],
 )
 def test_append_generic_statement(test_case_mock, statement):
@@ -103,6 +104,7 @@ def test_append_generic_statement(test_case_mock, statement):
     factory.add_method = mock_method
     factory.add_function = mock_method
     factory.add_field = mock_method
+    factory.add_enum = mock_method
     factory.add_primitive = mock_method
     result = factory.append_generic_accessible(test_case_mock, statement)
     assert result is None
@@ -156,6 +158,27 @@ def test_add_constructor(provide_callables_from_fixtures_modules, default_test_c
     assert default_test_case.size() == 2
 
 
+@pytest.mark.parametrize(
+    "exception",
+    [ConstructionFailedException("foo"), TypeError("foo")],
+)
+def test_add_constructor_wraps_failure(exception, constructor_mock, default_test_case):
+    factory = tf.TestFactory(default_test_case.test_cluster)
+    with mock.patch.object(factory, "satisfy_parameters", side_effect=exception):
+        with pytest.raises(ConstructionFailedException) as exc_info:
+            factory.add_constructor(default_test_case, constructor_mock)
+    assert exc_info.value.__cause__ is exception
+
+
+def test_add_constructor_does_not_catch_interrupt(constructor_mock, default_test_case):
+    factory = tf.TestFactory(default_test_case.test_cluster)
+    with mock.patch.object(
+        factory, "satisfy_parameters", side_effect=KeyboardInterrupt
+    ):
+        with pytest.raises(KeyboardInterrupt):
+            factory.add_constructor(default_test_case, constructor_mock)
+
+
 def test_add_method(provide_callables_from_fixtures_modules, default_test_case):
     object_ = Monkey("foo")
     methods = inspect.getmembers(object_, inspect.ismethod)
@@ -196,6 +219,18 @@ def test_add_method(provide_callables_from_fixtures_modules, default_test_case):
     assert default_test_case.size() == 2
 
 
+@pytest.mark.parametrize("method", ["add_method", "add_field"])
+def test_add_without_callee(method, default_test_case):
+    factory = tf.TestFactory(default_test_case.test_cluster)
+    accessible = MagicMock(
+        owner=default_test_case.test_cluster.type_system.to_type_info(Monkey)
+    )
+    with mock.patch.object(factory, "_create_or_reuse_variable", return_value=None):
+        with pytest.raises(ConstructionFailedException):
+            getattr(factory, method)(default_test_case, accessible)
+    assert default_test_case.size() == 0
+
+
 def test_add_function(provide_callables_from_fixtures_modules, default_test_case):
     config.configuration.test_creation.object_reuse_probability = 0.0
     generic_function = gao.GenericFunction(
@@ -233,6 +268,34 @@ def test_add_function(provide_callables_from_fixtures_modules, default_test_case
     assert default_test_case.size() <= 4
 
 
+def test_satisfy_parameters_reuses_candidates(default_test_case):
+    config.configuration.test_creation.primitive_reuse_probability = 1.0
+    type_system = default_test_case.test_cluster.type_system
+    int_stmt = stmt.IntPrimitiveStatement(default_test_case, 5)
+    default_test_case.add_statement(int_stmt)
+    signature = InferredSignature(
+        signature=Signature(
+            parameters=[
+                Parameter(name=name, kind=Parameter.POSITIONAL_OR_KEYWORD)
+                for name in ("x", "y", "z")
+            ]
+        ),
+        original_return_type=type_system.convert_type_hint(None),
+        original_parameters={
+            name: type_system.convert_type_hint(int) for name in ("x", "y", "z")
+        },
+        type_system=type_system,
+    )
+    factory = tf.TestFactory(default_test_case.test_cluster)
+    with mock.patch.object(
+        default_test_case, "get_objects", wraps=default_test_case.get_objects
+    ) as get_objects:
+        result = factory.satisfy_parameters(default_test_case, signature)
+        get_objects.assert_called_once()
+    assert result == {name: int_stmt.ret_val for name in ("x", "y", "z")}
+    assert default_test_case.size() == 1
+
+
 def test_add_enum(default_test_case):
     enum_ = enum.Enum("Foo", "BAR")
     generic_enum = gao.GenericEnum(
@@ -291,6 +354,26 @@ def test_attempt_generation_for_none_type(default_test_case):
     assert result.distance == 0
 
 
+def test_attempt_generation_for_none_type_reuses_none(default_test_case):
+    none_stmt = stmt.NoneStatement(default_test_case)
+    default_test_case.add_statement(none_stmt)
+    default_test_case.add_statement(stmt.IntPrimitiveStatement(default_test_case, 5))
+    factory = tf.TestFactory(default_test_case.test_cluster)
+    result = factory._attempt_generation(default_test_case, NoneType(), 2, 0, True)
+    assert result is none_stmt.ret_val
+    assert default_test_case.size() == 2
+
+
+def test_attempt_generation_for_none_type_ignores_later_none(default_test_case):
+    default_test_case.add_statement(stmt.IntPrimitiveStatement(default_test_case, 5))
+    none_stmt = stmt.NoneStatement(default_test_case)
+    default_test_case.add_statement(none_stmt)
+    factory = tf.TestFactory(default_test_case.test_cluster)
+    result = factory._attempt_generation(default_test_case, NoneType(), 1, 0, True)
+    assert result is not none_stmt.ret_val
+    assert default_test_case.size() == 3
+
+
 def test_attempt_generation_for_int_with_no_probability(default_test_case):
     config.configuration.test_creation.none_probability = 0.0
     factory = tf.TestFactory(default_test_case.test_cluster)
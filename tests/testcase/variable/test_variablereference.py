@@ -96,6 +96,19 @@ def test_var_get_position(test_case_mock):
     assert ref.get_statement_position() == 0
 
 
+def test_var_get_position_after_insertion(default_test_case):
+    int_0 = stmt.IntPrimitiveStatement(default_test_case, 5)
+    int_1 = stmt.IntPrimitiveStatement(default_test_case, 6)
+    default_test_case.add_statement(int_0)
+    default_test_case.add_statement(int_1)
+    assert int_1.ret_val.get_statement_position() == 1
+    default_test_case.add_statement(stmt.IntPrimitiveStatement(default_test_case), 0)
+    assert int_1.ret_val.get_statement_position() == 2
+    default_test_case.remove(0)
+    default_test_case.remove(0)
+    assert int_1.ret_val.get_statement_position() == 0
+
+
 def test_var_get_position_no_statements(test_case_mock):
     ref = vr.VariableReference(test_case_mock, int)
     test_case_mock.statements = []
@@ -103,6 +116,11 @@ def test_var_get_position_no_statements(test_case_mock):
         ref.get_statement_position()
 
 
+def test_var_has_no_instance_dict(test_case_mock):
+    ref = vr.VariableReference(test_case_mock, int)
+    assert not hasattr(ref, "__dict__")
+
+
 def test_var_hash(test_case_mock):
     ref = vr.VariableReference(test_case_mock, int)
     assert ref.structural_hash({ref: 0}) == 0
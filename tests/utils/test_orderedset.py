@@ -61,3 +61,14 @@ def test_ordereset_or_union(first, second, result):
 def test_ordereset_and_intersection(first, second, result):
     assert OrderedSet(first) & OrderedSet(second) == OrderedSet(result)
     assert OrderedSet(first).intersection(OrderedSet(second)) == OrderedSet(result)
+
+
+@pytest.mark.parametrize("index, result", [(0, 3), (1, 1), (2, 2)])
+def test_orderedset_getitem(index, result):
+    assert OrderedSet([3, 1, 2])[index] == result
+
+
+@pytest.mark.parametrize("index", [-1, 3])
+def test_orderedset_getitem_out_of_range(index):
+    with pytest.raises(IndexError):
+        OrderedSet([3, 1, 2])[index]